@@ -1,11 +1,11 @@
 import sqlite3
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import pandas as pd
 import streamlit as st
 from pandas import DataFrame
-from sqlalchemy import Connection, Engine, TextClause, create_engine, text
+from sqlalchemy import Connection, Engine, TextClause, create_engine, event, text
 from sqlalchemy.exc import DatabaseError, OperationalError
 from streamlit.delta_generator import DeltaGenerator
 
@@ -18,6 +18,7 @@ from src import (
 )
 from src.components import USER_HOME
 from src.components.filepicker import tk_FilePicker
+from src.stats import OA_NORMALIZED_COLUMNS, tuneSQLiteConnection
 
 
 def updateFilePathInputLabel() -> None:
@@ -27,6 +28,12 @@ def updateFilePathInputLabel() -> None:
         st.session_state["db_filepath_label"] = filePath
 
 
+def configureDBConnection(dbapiConnection: sqlite3.Connection, _: Any) -> None:
+    tuneSQLiteConnection(db=dbapiConnection)
+    # The app never writes, and searchDatabase() interpolates user input
+    dbapiConnection.execute("PRAGMA query_only = 1")
+
+
 def validateDBPath() -> None:
     st.session_state["db_valid"] = False
     dbFilepath: str = st.session_state["db_filepath_label"]
@@ -48,6 +55,12 @@ def validateDBPath() -> None:
         st.error(ERROR_DB_CONN.format(dbFilepath), icon="🚨")
         return
 
+    event.listen(
+        target=engine,
+        identifier="connect",
+        fn=configureDBConnection,
+    )
+
     try:
         conn: Connection = engine.connect()
         conn.execute(
@@ -96,7 +109,10 @@ def searchDatabase():
     df: DataFrame = pd.read_sql_query(
         sql=sqlQuery,
         con=dbConn,
+        dtype_backend="pyarrow",
     )
+    # Hide the columns that src.stats.stats adds to the works table
+    df = df.drop(columns=list(OA_NORMALIZED_COLUMNS), errors="ignore")
 
     if df.empty:
         st.warning(body="Query returned no results", icon="👻")
@@ -1,3 +1,4 @@
+from pathlib import Path
 from sqlite3 import Connection, Cursor
 from typing import Any, Iterable, List
 
@@ -6,6 +7,20 @@ OA_OAID_COUNT: int = 13435534
 OA_CITATION_COUNT: int = 113563323
 OAPM_ARXIV_PM_PAPERS_IN_OA: int = 14
 
+CACHE_DIRECTORY: Path = Path(".cache")
+
+# Standardized columns that src.stats.stats adds to the OpenAlex works table,
+# mapped to their source columns
+OA_NORMALIZED_COLUMNS: dict[str, str] = {"doi_norm": "doi", "title_norm": "title"}
+
+# Matches the userinfo, host, and port of an absolute or scheme-relative URL
+# (RFC 3986 scheme). Kept as a string with inline flags so that it also runs on
+# Arrow (RE2) arrays
+URL_NETLOC_PATTERN: str = (
+    r"(?i)^(?:[a-z][a-z0-9+.\-]*:)?//"
+    r"(?P<userinfo>[^/?#]*@)?(?P<host>[^/?#]*?)(?P<port>:[0-9]*)?(?:[/?#]|$)"
+)
+
 NATURE_SUBJECTS: List[str] = [
     "Physics",
     "Astronomy and planetary science",
@@ -92,3 +107,19 @@ def runOneValueSQLQuery(db: Connection, query: str) -> Iterable[Any]:
     """
     cursor: Cursor = db.execute(query)
     return cursor.fetchone()
+
+
+def tuneSQLiteConnection(db: Connection) -> None:
+    """
+    tuneSQLiteConnection Tune an SQLite3 connection for large sequential scans
+
+    Enables memory mapped I/O, a larger page cache, and in-memory TEMP tables
+
+    :param db: An sqlite3.Connection object
+    :type db: Connection
+    """
+    db.execute("PRAGMA temp_store = MEMORY")
+    # Negative values are in KiB (1 GiB)
+    db.execute("PRAGMA cache_size = -1048576")
+    # Capped by SQLITE_MAX_MMAP_SIZE at compile time
+    db.execute("PRAGMA mmap_size = 30000000000")
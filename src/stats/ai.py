@@ -35,7 +35,17 @@ from src.stats import NATURE_SUBJECTS
     default=Path("../../data/json"),
     show_default=True,
 )
-def main(abstractDirectory: Path, jsonDirectory: Path) -> None:
+@click.option(
+    "-c",
+    "--max-concurrency",
+    "maxConcurrency",
+    required=False,
+    type=int,
+    help="Maximum number of concurrent requests to the LLM",
+    default=4,
+    show_default=True,
+)
+def main(abstractDirectory: Path, jsonDirectory: Path, maxConcurrency: int) -> None:
     absAbstractDirectory: Path = resolvePath(path=abstractDirectory)
     absJSONDirectory: Path = resolvePath(path=jsonDirectory)
 
@@ -78,10 +88,18 @@ def main(abstractDirectory: Path, jsonDirectory: Path) -> None:
 
     ptm: str
     for ptm in ptms:
-        data[ptm] = []
-        with Bar(f"Analyzing {ptm} abstracts...", max=df[ptm].shape[0]) as bar:
-            for abstract in df[ptm]:
-                data[ptm].append(chain.invoke({"input": abstract}))
+        inputs: List[dict[str, str]] = [{"input": abstract} for abstract in df[ptm]]
+        data[ptm] = [""] * len(inputs)
+
+        # Requests are I/O bound, so overlap them instead of waiting on each one
+        with Bar(f"Analyzing {ptm} abstracts...", max=len(inputs)) as bar:
+            idx: int
+            classification: str
+            for idx, classification in chain.batch_as_completed(
+                inputs,
+                config={"max_concurrency": maxConcurrency},
+            ):
+                data[ptm][idx] = classification
                 bar.next()
 
     DataFrame(data=data).T.to_json(
@@ -4,7 +4,11 @@ from string import Template
 from typing import List
 
 import click
-import matplotlib.pyplot as plt
+import matplotlib
+
+matplotlib.use(backend="Agg")
+
+import matplotlib.pyplot as plt  # isort: skip
 import seaborn
 from humanize import intcomma
 from matplotlib.axes import Axes
@@ -101,11 +105,7 @@ def plot_PMPublicationVenuePaperCount(
     :param filepath: Path to save figure to
     :type filepath: Path
     """
-    data: Series = venuePaperCounts.iloc[0:4]
-
-    url: str
-    for url in data.index:
-        data = data.rename({url: _renameURL(url=url)})
+    data: Series = venuePaperCounts.iloc[0:4].rename(index=_renameURL)
 
     other: int = venuePaperCounts[4:].sum()
     data["Other"] = other
@@ -350,7 +350,7 @@ def main(
     assert isFile(path=absOAPath)
     assert isFile(path=absAIClassesPath)
 
-    pmDB: Connection = connectToDB(dbPath=absPMPath)
+    pmDB: Connection = connectToDB(dbPath=absPMPath, readOnly=True)
     oaDB: Connection = connectToDB(dbPath=absOAPath)
 
     oaPaperCounts: int = oa_CountPapersByDOI(oaDB=oaDB)
@@ -366,8 +366,9 @@ def main(
             filepath_or_buffer=absPMACCP,
         )
     except FileNotFoundError:
+        oa_PrepareDB(oaDB=oaDB)
         pmPaperCitationCounts = oapm_CountCitationsOfArXivPMPapers(
-            pmDB=pmDB,
+            arxivPMDF=pm_IdentifyPapersPublishedInArXiv(pmDB=pmDB),
             oaDB=oaDB,
         )
         pmPaperCitationCounts.to_pickle(path=absPMACCP)
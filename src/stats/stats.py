@@ -1,8 +1,10 @@
+import pickle
+from functools import wraps
+from hashlib import blake2b
+from inspect import getsourcefile
 from pathlib import Path
-from sqlite3 import Connection
-from string import Template
-from typing import Any, Iterable, List
-from urllib.parse import urlparse
+from sqlite3 import Connection, Cursor
+from typing import Any, Callable, Iterable, List
 
 import click
 import pandas
@@ -10,38 +12,77 @@ import pandas as pd
 from humanize import intcomma
 from pandas import DataFrame, Series
 from progress.bar import Bar
-from progress.spinner import Spinner
 from pyfs import isDirectory, isFile, resolvePath
 
+import src.stats
 from src.stats import (
+    CACHE_DIRECTORY,
     OA_CITATION_COUNT,
     OA_DOI_COUNT,
+    OA_NORMALIZED_COLUMNS,
     OA_OAID_COUNT,
     OAPM_ARXIV_PM_PAPERS_IN_OA,
+    URL_NETLOC_PATTERN,
     runOneValueSQLQuery,
+    tuneSQLiteConnection,
 )
 
 
-def _createDFGeneratorFromSQL(
-    db: Connection,
-    query: str,
-    chunkSize: int = 10000,
-) -> Iterable[DataFrame]:
+def _diskCache(function: Callable[..., Any]) -> Callable[..., Any]:
     """
-    _createDFGeneratorFromSQL Return a generator of Pandas DataFrames to process large SQL query results
+    _diskCache Cache the pickled return value of a function on disk, keyed on its source code and arguments
 
-    :param db: An sqlite3.Connection object
-    :type db: Connection
-    :param query: The SQLite3 compatible query to run
-    :type query: str
-    :param chunkSize: The number of rows per DataFrame to return, defaults to 10000
-    :type chunkSize: int, optional
-    :return: A generator of Pandas DataFrames
-    :rtype: _type_
-    :yield: A pandas.DataFrame
-    :rtype: Iterable[DataFrame]
+    :param function: The function to cache
+    :type function: Callable[..., Any]
+    :return: The wrapped function
+    :rtype: Callable[..., Any]
     """
-    return pd.read_sql_query(query, con=db, chunksize=chunkSize)
+
+    sourceHash: str = blake2b(
+        Path(getsourcefile(function)).read_bytes()
+        + Path(getsourcefile(src.stats)).read_bytes(),
+        digest_size=16,
+    ).hexdigest()
+
+    @wraps(wrapped=function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        keyParts: List[str] = [function.__name__, sourceHash]
+
+        arguments: dict[str, Any] = {
+            **{str(idx): arg for idx, arg in enumerate(args)},
+            **kwargs,
+        }
+
+        name: str
+        value: Any
+        for name, value in arguments.items():
+            if isinstance(value, Connection):
+                dbPath: str = value.execute("PRAGMA database_list").fetchone()[2]
+                if dbPath == "":
+                    return function(*args, **kwargs)
+
+                value = f"{dbPath}:{Path(dbPath).stat().st_mtime_ns}"
+            elif isinstance(value, (DataFrame, Series)):
+                value = pandas.util.hash_pandas_object(obj=value).sum()
+
+            keyParts.append(f"{name}={value!r}")
+
+        key: str = blake2b("|".join(keyParts).encode(), digest_size=16).hexdigest()
+        cachePath: Path = Path(CACHE_DIRECTORY, f"{function.__name__}_{key}.pickle")
+
+        if cachePath.exists():
+            with open(file=cachePath, mode="rb") as fp:
+                return pickle.load(file=fp)
+
+        result: Any = function(*args, **kwargs)
+
+        cachePath.parent.mkdir(parents=True, exist_ok=True)
+        with open(file=cachePath, mode="wb") as fp:
+            pickle.dump(obj=result, file=fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+        return result
+
+    return wrapper
 
 
 def _createDFFromSQL(db: Connection, query: str) -> DataFrame:
@@ -57,58 +98,211 @@ def _createDFFromSQL(db: Connection, query: str) -> DataFrame:
     :return: A pandas.DataFrame of the SQL query results
     :rtype: DataFrame
     """
-    return pd.read_sql_query(query, con=db)
+    return pd.read_sql_query(query, con=db, dtype_backend="pyarrow")
 
 
-def _extractNetLoc(url: str) -> str:
+def _extractNetLoc(urls: Series) -> Series:
     """
-    _extractNetLoc Return the netloc attribute of a URL if it exists
+    _extractNetLoc Return the netloc attribute of each URL if it exists
+
+    Only the host is lower cased, as WHATWG URL parsers do, and URLs without a
+    netloc are mapped to an empty string
 
-    :param url: A URL to parse
-    :type url: str
-    :return: the netloc attribute of the URL
-    :rtype: str
+    :param urls: A pandas.Series of URLs to parse
+    :type urls: Series
+    :return: A pandas.Series of the netloc attribute of each URL
+    :rtype: Series
     """
-    return urlparse(url=url).netloc
+    parts: DataFrame = urls.str.extract(pat=URL_NETLOC_PATTERN, expand=True)
+
+    return (
+        parts["userinfo"].fillna(value="")
+        + parts["host"].str.lower()
+        + parts["port"].fillna(value="")
+    ).fillna(value="")
 
 
-def _convertToArXivDOI(arxivURL: str) -> str:
+def _convertToArXivDOI(arxivURLs: Series) -> Series:
     """
-    _convertToArXivDOI Given an arXiv compliant URL, create the arXiv DOI from it
+    _convertToArXivDOI Given arXiv compliant URLs, create the arXiv DOIs from them
 
-    :param arxivURL: An arXiv compatible URL (https://arxiv.org/abs/)
-    :type arxivURL: str
-    :return: An arXiv compatible DOI
-    :rtype: str
+    :param arxivURLs: A pandas.Series of arXiv compatible URLs (https://arxiv.org/abs/)
+    :type arxivURLs: Series
+    :return: A pandas.Series of arXiv compatible DOIs
+    :rtype: Series
     """
-    return arxivURL.replace(
-        "https://arxiv.org/abs/",
-        "10.48550/arxiv.",
+    return arxivURLs.str.replace(
+        pat="https://arxiv.org/abs/",
+        repl="10.48550/arxiv.",
+        regex=False,
     )
 
 
-def _standardizeText(text: str) -> str:
+def _standardizeText(text: str | None) -> str | None:
     """
     _standardizeText Remove trailing whitespace(s) and make text lower case
 
     :param text: The text to format
-    :type text: str
-    :return: A formatted string of the input text
-    :rtype: str
+    :type text: str | None
+    :return: A formatted string of the input text, or None if it is not a string
+    :rtype: str | None
     """
+    if not isinstance(text, str):
+        return None
+
     return text.strip().lower()
 
 
-def connectToDB(dbPath: Path) -> Connection:
+def _createTempTable(
+    db: Connection,
+    table: str,
+    column: str,
+    values: Iterable[str],
+) -> None:
+    """
+    _createTempTable Create (or replace) a single column TEMP table of unique values
+
+    Used to push membership tests against small Python-side sets into SQLite
+
+    :param db: An sqlite3.Connection object
+    :type db: Connection
+    :param table: The name of the TEMP table
+    :type table: str
+    :param column: The name of the TEXT column (also the primary key)
+    :type column: str
+    :param values: The values to insert into the table
+    :type values: Iterable[str]
+    """
+    with db:
+        db.execute(f"DROP TABLE IF EXISTS temp.{table}")
+        # WITHOUT ROWID stores the values in the primary key B-tree itself
+        db.execute(
+            f"CREATE TEMP TABLE {table} ({column} TEXT PRIMARY KEY) WITHOUT ROWID"
+        )
+        db.executemany(
+            f"INSERT OR IGNORE INTO temp.{table} VALUES (?)",
+            ((value,) for value in values),
+        )
+
+
+def _ensureNormalizedColumns(oaDB: Connection) -> None:
+    """
+    _ensureNormalizedColumns Permanently add indexed, standardized DOI and title columns to an OpenAlex works table
+
+    :param oaDB: A sqlite3.Connection object to an OpenAlex dataset
+    :type oaDB: Connection
+    """
+    columns: List[str] = [
+        row[1] for row in oaDB.execute("PRAGMA table_info(works)").fetchall()
+    ]
+
+    alterStatements: List[str] = []
+    updates: List[str] = []
+    indexStatements: List[str] = []
+    column: str
+    source: str
+    for column, source in OA_NORMALIZED_COLUMNS.items():
+        if column in columns:
+            continue
+
+        alterStatements.append(f"ALTER TABLE works ADD COLUMN {column} TEXT;")
+        updates.append(f"{column} = standardize_text({source})")
+        indexStatements.append(
+            f"CREATE INDEX IF NOT EXISTS idx_works_{column} ON works ({column});"
+        )
+
+    if len(updates) == 0:
+        return
+
+    oaDB.create_function("standardize_text", 1, _standardizeText, deterministic=True)
+    oaDB.executescript(
+        "\n".join(
+            [
+                "BEGIN;",
+                *alterStatements,
+                f"UPDATE works SET {', '.join(updates)};",
+                *indexStatements,
+                "COMMIT;",
+            ]
+        )
+    )
+
+
+def _createOAIndices(oaDB: Connection) -> None:
+    """
+    _createOAIndices Create the indices that OpenAlex citation queries rely on
+
+    Indices are only built the first time this is called on a database
+
+    :param oaDB: A sqlite3.Connection object to an OpenAlex dataset
+    :type oaDB: Connection
+    """
+    with oaDB:
+        oaDB.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cites_reference ON cites (reference)",
+        )
+
+
+@_diskCache
+def _runCachedOneValueSQLQuery(db: Connection, query: str) -> Iterable[Any]:
+    """
+    _runCachedOneValueSQLQuery Execute an SQL query that returns one value and cache the result on disk
+
+    Only use this for queries over persistent tables, as TEMP tables are not
+    part of the cache key
+
+    :param db: An sqlite3.Connection object
+    :type db: Connection
+    :param query: A SQLite3 compatible query
+    :type query: str
+    :return: An iterator containing any value
+    :rtype: Iterable[Any]
+    """
+    return runOneValueSQLQuery(db=db, query=query)
+
+
+def connectToDB(dbPath: Path, readOnly: bool = False) -> Connection:
     """
     connectToDB Connect to a SQLite3 database and return the sqlite3.Connection object
 
+    The connection is tuned for large sequential scans (memory mapped I/O, a
+    larger page cache, and in-memory TEMP tables). Read-only connections are
+    opened as immutable, so the database must not be modified while connected
+
     :param dbPath: Filepath to a SQLite3 database
     :type dbPath: Path
+    :param readOnly: Open the database as read-only and immutable, defaults to False
+    :type readOnly: bool, optional
     :return: The sqlite3.Connection object
     :rtype: Connection
     """
-    return Connection(database=dbPath)
+    db: Connection
+    if readOnly:
+        db = Connection(
+            database=f"{Path(dbPath).absolute().as_uri()}?mode=ro&immutable=1",
+            uri=True,
+        )
+    else:
+        db = Connection(database=dbPath)
+
+    tuneSQLiteConnection(db=db)
+
+    return db
+
+
+def oa_PrepareDB(oaDB: Connection, addNormalizedColumns: bool = True) -> None:
+    """
+    oa_PrepareDB Add the indices, and optionally the standardized columns, that OpenAlex queries rely on
+
+    :param oaDB: A sqlite3.Connection object to an OpenAlex dataset
+    :type oaDB: Connection
+    :param addNormalizedColumns: Also add the standardized DOI and title columns, defaults to True
+    :type addNormalizedColumns: bool, optional
+    """
+    if addNormalizedColumns:
+        _ensureNormalizedColumns(oaDB=oaDB)
+
+    _createOAIndices(oaDB=oaDB)
 
 
 def oa_CountPapersByDOI(
@@ -118,7 +312,7 @@ def oa_CountPapersByDOI(
     """
     oa_CountPapersByDOI Count the number of papers within an OpenAlex dataset by the unique DOI
 
-    DOIs that contain a space are excluded from the count
+    Empty DOIs (NULL or a single space) are excluded from the count
 
     :param oaDB: A sqlite3.Connection object to an OpenAlex dataset
     :type oaDB: Connection
@@ -127,24 +321,11 @@ def oa_CountPapersByDOI(
     :return: The number of papers in the dataset that have a unqiue DOI
     :rtype: int
     """
+    query: str = "SELECT COUNT(DISTINCT doi) FROM works WHERE doi != ' '"
     if returnDefault:
         return OA_DOI_COUNT
     else:
-        doiCount: int = 0
-        query: str = "SELECT DISTINCT doi FROM works"
-        dfs: Iterable[DataFrame] = _createDFGeneratorFromSQL(db=oaDB, query=query)
-
-        with Spinner(
-            message="Counting number of papers in OpenAlex by DOI...",
-        ) as spinner:
-            df: DataFrame
-            for df in dfs:
-                df["doi"] = df["doi"].replace(to_replace=" ", value=None)
-                df.dropna(inplace=True)
-                doiCount += df.shape[0]
-                spinner.next()
-
-        return doiCount
+        return _runCachedOneValueSQLQuery(db=oaDB, query=query)[0]
 
 
 def oa_CountPapersByOAID(
@@ -165,7 +346,7 @@ def oa_CountPapersByOAID(
     if returnDefault:
         return OA_OAID_COUNT
     else:
-        return runOneValueSQLQuery(db=oaDB, query=query)[0]
+        return _runCachedOneValueSQLQuery(db=oaDB, query=query)[0]
 
 
 def oa_ProportionOfValidPapers(oaIDCount: int, oaDOICount: int) -> float:
@@ -196,11 +377,11 @@ def oa_CountCitations(
     :return: The number of citations in the OpenAlex dataset
     :rtype: int
     """
-    query: str = "SELECT id FROM cites ORDER BY id DESC LIMIT 1"
+    query: str = "SELECT max(id) FROM cites"
     if returnDefault:
         return OA_CITATION_COUNT
     else:
-        return runOneValueSQLQuery(db=oaDB, query=query)[0]
+        return _runCachedOneValueSQLQuery(db=oaDB, query=query)[0]
 
 
 def oapm_ProportionOfPMPapersInOA(
@@ -221,7 +402,7 @@ def oapm_ProportionOfPMPapersInOA(
 
 
 def oapm_CountPMArXivPapersInOA(
-    pmDB: Connection,
+    arxivPMDF: DataFrame | None,
     oaDB: Connection,
     returnDefault: bool = True,
 ) -> int:
@@ -230,9 +411,9 @@ def oapm_CountPMArXivPapersInOA(
 
     arXiv papers are determined by DOI
 
-    :param pmDB: A sqlite3.Connection object of a PeaTMOSS database
-    :type pmDB: Connection
-    :param oaDB: A sqlite3.Connection object of an OpenAlex database
+    :param arxivPMDF: The PeaTMOSS arXiv papers from pm_IdentifyPapersPublishedInArXiv, only read if returnDefault is False
+    :type arxivPMDF: DataFrame | None
+    :param oaDB: A sqlite3.Connection object of an OpenAlex database prepared with oa_PrepareDB
     :type oaDB: Connection
     :param returnDefault: Skip computing the value and use the pre-computed value, defaults to True
     :type returnDefault: bool, optional
@@ -242,82 +423,54 @@ def oapm_CountPMArXivPapersInOA(
     if returnDefault:
         return OAPM_ARXIV_PM_PAPERS_IN_OA
 
-    count: int = 0
-
-    oaQuery: str = "SELECT DISTINCT doi FROM works"
-
-    arxivPMDF: DataFrame = pm_IdentifyPapersPublishedInArXiv(pmDB=pmDB)
+    oaQuery: str = """
+        SELECT COUNT(DISTINCT doi) FROM works
+        WHERE doi_norm IN (SELECT doi FROM arxiv_pm)
+    """
 
-    oaDFs: Iterable[DataFrame] = _createDFGeneratorFromSQL(
+    _createTempTable(
         db=oaDB,
-        query=oaQuery,
+        table="arxiv_pm",
+        column="doi",
+        values=arxivPMDF["url"].dropna(),
     )
 
-    with Spinner(
-        message="Counting the number of PeaTMOSS papers published in arXiv that are captured in OpenAlex...",
-    ) as spinner:
-        df: DataFrame
-        for df in oaDFs:
-            df["doi"] = df["doi"].apply(_standardizeText)
-            count += df[df["doi"].isin(arxivPMDF["url"])].shape[0]
-            spinner.next()
-
-    return count
+    return runOneValueSQLQuery(db=oaDB, query=oaQuery)[0]
 
 
+@_diskCache
 def oapm_CountCitationsOfArXivPMPapers(
-    pmDB: Connection,
+    arxivPMDF: DataFrame,
     oaDB: Connection,
 ) -> Series:
     """
     oapm_CountCitationsOfArXivPMPapers Count the number of OpenAlex papers that cite PeatMOSS arXiv papers
 
-    :param pmDB: A sqlite3.Connection of a PeaTMOSS database
-    :type pmDB: Connection
-    :param oaDB: A sqlite3.Connection of a OpenAlex database
+    :param arxivPMDF: The PeaTMOSS arXiv papers from pm_IdentifyPapersPublishedInArXiv
+    :type arxivPMDF: DataFrame
+    :param oaDB: A sqlite3.Connection of a OpenAlex database prepared with oa_PrepareDB
     :type oaDB: Connection
     :return: A Series of the number of citations a PeaTMOSS arXiv paper recieved
     :rtype: Series
     """
-    worksQuery: str = "SELECT oa_id, title FROM works"
-    citesQuery: str = "SELECT reference FROM cites"
-
-    relevantWorksDFs: List[DataFrame] = []
-    relevantCitesDFs: List[DataFrame] = []
-
-    pmDF: DataFrame = pm_IdentifyPapersPublishedInArXiv(pmDB=pmDB)
-    pmDF["title"] = pmDF["title"].apply(_standardizeText)
+    query: str = """
+        SELECT reference, COUNT(*) AS count FROM cites
+        WHERE reference IN (
+            SELECT oa_id FROM works
+            WHERE title_norm IN (SELECT title FROM pm_titles)
+        )
+        GROUP BY reference
+        ORDER BY count DESC
+    """
 
-    oaWorksDFs: Iterable[DataFrame] = _createDFGeneratorFromSQL(
+    _createTempTable(
         db=oaDB,
-        query=worksQuery,
-    )
-    oaCitesDFs: Iterable[DataFrame] = _createDFGeneratorFromSQL(
-        db=oaDB,
-        query=citesQuery,
-    )
-
-    with Spinner(message="Identifying rows with relevant arXiv papers...") as spinner:
-        df: DataFrame
-        for df in oaWorksDFs:
-            df["title"] = df["title"].apply(_standardizeText)
-            relevantWorksDFs.append(df[df["title"].isin(pmDF["title"])])
-            spinner.next()
-
-    oaWorksDF: DataFrame = pandas.concat(
-        objs=relevantWorksDFs,
-        ignore_index=True,
+        table="pm_titles",
+        column="title",
+        values=map(_standardizeText, arxivPMDF["title"].dropna()),
     )
 
-    with Spinner(message="Identifying rows that cite arXiv papers...") as spinner:
-        df: DataFrame
-        for df in oaCitesDFs:
-            relevantCitesDFs.append(df[df["reference"].isin(oaWorksDF["oa_id"])])
-            spinner.next()
-
-    return pandas.concat(objs=relevantCitesDFs, ignore_index=True)[
-        "reference"
-    ].value_counts(sort=True)
+    return _createDFFromSQL(db=oaDB, query=query).set_index(keys="reference")["count"]
 
 
 def pm_CountPapersByID(pmDB: Connection) -> int:
@@ -334,6 +487,7 @@ def pm_CountPapersByID(pmDB: Connection) -> int:
     return runOneValueSQLQuery(db=pmDB, query=query)[0]
 
 
+@_diskCache
 def pm_CountPapersPerJournal(pmDB: Connection) -> Series:
     """
     pm_CountPapersPerJournal Count the number of papers per journal in PeaTMOSS
@@ -345,10 +499,11 @@ def pm_CountPapersPerJournal(pmDB: Connection) -> Series:
     """
     query: str = "SELECT url FROM paper"
     df: DataFrame = _createDFFromSQL(db=pmDB, query=query)
-    df["url"] = df["url"].apply(_extractNetLoc)
+    df["url"] = _extractNetLoc(urls=df["url"])
     return df["url"].value_counts(sort=True, dropna=False)
 
 
+@_diskCache
 def pm_IdentifyPapersPublishedInArXiv(pmDB: Connection) -> DataFrame:
     """
     pm_IdentifyPapersPublishedInArXiv Identify the papers in PeaTMOSS published in arXiv by DOI
@@ -358,12 +513,13 @@ def pm_IdentifyPapersPublishedInArXiv(pmDB: Connection) -> DataFrame:
     :return: A pandas.DataFrame object of the relevant data for this project
     :rtype: DataFrame
     """
-    query: str = "SELECT title, url FROM paper"
+    # Both arXiv URLs and arXiv DOIs contain "arxiv", so skip every other row
+    query: str = "SELECT title, url FROM paper WHERE instr(url, 'arxiv') > 0"
 
     pmDF: DataFrame = _createDFFromSQL(db=pmDB, query=query)
-    pmDF["url"] = pmDF["url"].apply(_convertToArXivDOI)
+    pmDF["url"] = _convertToArXivDOI(arxivURLs=pmDF["url"])
 
-    return pmDF[pmDF["url"].str.contains("10.48550/arxiv.")]
+    return pmDF[pmDF["url"].str.contains("10.48550/arxiv.", regex=False, na=False)]
 
 
 def oapm_GetDOIsOfOAWorksThatCitePM(
@@ -372,15 +528,13 @@ def oapm_GetDOIsOfOAWorksThatCitePM(
     jsonOutputPath: Path,
 ) -> dict[str, DataFrame]:
     ptms: List[str] = ["ResNeXt", "Transformer-XL", "HRNet", "MAE"]
-    dfsDict: dict[str, DataFrame] = {}
     dois: dict[str, List[str]] = {ptm: [] for ptm in ptms}
 
-    citeQueryTemplate: Template = Template(
-        template="SELECT work, reference FROM cites WHERE reference = '${oaID}'"
-    )
-    doiQueryTemplate: Template = Template(
-        template="SELECT oa_id, doi FROM works WHERE oa_id = '${oaID}'"
-    )
+    citeQuery: str = "SELECT work FROM cites WHERE reference = ?"
+    doiQuery: str = """
+        SELECT oa_id, doi FROM works
+        WHERE oa_id IN (SELECT oa_id FROM citing_works)
+    """
 
     # Top 5 choosen because the 4th entry is a dataset and not a DNN
     data: Series = pmCitationCounts[0:5]
@@ -388,32 +542,34 @@ def oapm_GetDOIsOfOAWorksThatCitePM(
     oaIDs: List[str] = data.index.to_list()
 
     with Bar(
-        "Creating DataFrames of works that cite PeaTMOSS papers...", max=len(oaIDs)
+        "Identifying DOIs of works that cite PeaTMOSS papers...", max=len(oaIDs)
     ) as bar:
         ptmIDX: int = 0
         oaID: str
         for oaID in oaIDs:
-            query: str = citeQueryTemplate.substitute(oaID=oaID)
-            dfsDict[ptms[ptmIDX]] = _createDFFromSQL(db=oaDB, query=query)
+            cursor: Cursor = oaDB.execute(citeQuery, (oaID,))
+            # dict.fromkeys() drops duplicates while keeping the row order
+            workOAIDs: List[str] = list(dict.fromkeys(row[0] for row in cursor))
+
+            _createTempTable(
+                db=oaDB,
+                table="citing_works",
+                column="oa_id",
+                values=workOAIDs,
+            )
+
+            workDOIs: dict[str, str] = {}
+            workOAID: str
+            doi: str
+            for workOAID, doi in oaDB.execute(doiQuery):
+                workDOIs.setdefault(workOAID, doi)
+
+            dois[ptms[ptmIDX]] = [
+                f"https://doi.org/{workDOIs[workOAID]}" for workOAID in workOAIDs
+            ]
             ptmIDX += 1
             bar.next()
 
-    ptm: str
-    for ptm in ptms:
-        df: DataFrame = dfsDict[ptm]
-        workOAIDs: List[str] = df["work"].unique().tolist()
-
-        with Bar(
-            f"Identifying DOIs per work that cites {ptm}...", max=len(workOAIDs)
-        ) as bar:
-            oaID: str
-            for oaID in workOAIDs:
-                query: str = doiQueryTemplate.substitute(oaID=oaID)
-                dois[ptm].append(
-                    f"https://doi.org/{runOneValueSQLQuery(db=oaDB, query=query)[1]}"
-                )
-                bar.next()
-
     for items in dois.items():
         jsonFilePath: Path = Path(jsonOutputPath, f"{items[0]}.json")
         foo: dict[str, List[str]] = {items[0]: items[1]}
@@ -471,11 +627,21 @@ def oapm_GetDOIsOfOAWorksThatCitePM(
     default=Path("../../data/json"),
     show_default=True,
 )
+@click.option(
+    "-r",
+    "--recompute-counts",
+    "recomputeCounts",
+    is_flag=True,
+    help="Compute OpenAlex counts from the database instead of using pre-computed values",
+    default=False,
+    show_default=True,
+)
 def main(
     pmPath: Path,
     oaPath: Path,
     pmArxivCitationCount: Path,
     jsonOutput: Path,
+    recomputeCounts: bool,
 ) -> None:
     absPMPath: Path = resolvePath(path=pmPath)
     absOAPath: Path = resolvePath(path=oaPath)
@@ -487,22 +653,32 @@ def main(
     assert isFile(path=absPMACCPath)
     assert isDirectory(path=absJOPath)
 
-    pmDB: Connection = connectToDB(dbPath=absPMPath)
+    pmDB: Connection = connectToDB(dbPath=absPMPath, readOnly=True)
     oaDB: Connection = connectToDB(dbPath=absOAPath)
+    oa_PrepareDB(oaDB=oaDB, addNormalizedColumns=recomputeCounts)
 
-    oaPaperCountByDOI: int = oa_CountPapersByDOI(oaDB=oaDB)
+    oaPaperCountByDOI: int = oa_CountPapersByDOI(
+        oaDB=oaDB,
+        returnDefault=not recomputeCounts,
+    )
     print(
         "Number of papers with DOIs in OpenAlex:",
         intcomma(value=oaPaperCountByDOI),
     )
 
-    oaPaperCountByOAID: int = oa_CountPapersByOAID(oaDB=oaDB)
+    oaPaperCountByOAID: int = oa_CountPapersByOAID(
+        oaDB=oaDB,
+        returnDefault=not recomputeCounts,
+    )
     print(
         "Number of papers with OAIDs in OpenAlex:",
         intcomma(value=oaPaperCountByOAID),
     )
 
-    oaCitationCount: int = oa_CountCitations(oaDB=oaDB)
+    oaCitationCount: int = oa_CountCitations(
+        oaDB=oaDB,
+        returnDefault=not recomputeCounts,
+    )
     print(
         "Number of citations captured in OpenAlex:",
         intcomma(value=oaCitationCount),
@@ -523,9 +699,15 @@ def main(
         intcomma(value=pmPaperCountByID),
     )
 
+    # paper is only read when a value is computed from it
+    arxivPMDF: DataFrame | None = None
+    if recomputeCounts:
+        arxivPMDF = pm_IdentifyPapersPublishedInArXiv(pmDB=pmDB)
+
     pmArxivPapersInOA: int = oapm_CountPMArXivPapersInOA(
-        pmDB=pmDB,
+        arxivPMDF=arxivPMDF,
         oaDB=oaDB,
+        returnDefault=not recomputeCounts,
     )
     print(
         "Number of PeaTMOSS papers captured in OpenAlex that were published in arXiv:",
@@ -542,8 +724,12 @@ def main(
     try:
         oapm_arXivPMPapers = pandas.read_pickle(filepath_or_buffer=absPMACCPath)
     except FileExistsError:
+        if arxivPMDF is None:
+            arxivPMDF = pm_IdentifyPapersPublishedInArXiv(pmDB=pmDB)
+
+        oa_PrepareDB(oaDB=oaDB)
         oapm_arXivPMPapers = oapm_CountCitationsOfArXivPMPapers(
-            pmDB=pmDB,
+            arxivPMDF=arxivPMDF,
             oaDB=oaDB,
         )
         oapm_arXivPMPapers.to_pickle(path=absPMACCPath)